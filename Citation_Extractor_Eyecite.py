@@ -1,18 +1,30 @@
 from eyecite import get_citations, resolve_citations
-from eyecite.clean import clean_text
+from eyecite.clean import all_whitespace, clean_text, html, inline_whitespace, underscores
+from eyecite.tokenizers import Tokenizer, default_tokenizer
+import os
+
+# Use the Hyperscan tokenizer when available; the compiled database is cached
+# on disk (HYPERSCAN_CACHE_DIR) so later runs load it instead of recompiling.
+TOKENIZER: Tokenizer
+try:
+    import hyperscan  # noqa: F401
+    from eyecite.tokenizers import HyperscanTokenizer
+    TOKENIZER = HyperscanTokenizer(cache_dir=os.getenv('HYPERSCAN_CACHE_DIR', '.hyperscan_cache'))
+except ImportError:
+    TOKENIZER = default_tokenizer
+
+# Define the cleaning steps once using actual functions from eyecite.clean
+STEPS = (
+    html,                   # Removes HTML markup
+    inline_whitespace,      # Collapses multiple spaces or tabs into one space
+    all_whitespace,         # Collapses multiple whitespace characters into one space
+    underscores             # Removes strings of two or more underscores
+)
 
 def extract_citations(text):
-    # Define the cleaning steps using actual functions from eyecite.clean
-    steps = [
-        'html',                 # Removes HTML markup
-        'inline_whitespace',    # Collapses multiple spaces or tabs into one space
-        'all_whitespace',       # Collapses multiple whitespace characters into one space
-        'underscores'           # Removes strings of two or more underscores
-    ]
-
     # Clean the text and extract citations
-    cleaned_text = clean_text(text, steps)
-    citations = get_citations(cleaned_text)
+    cleaned_text = clean_text(text, STEPS)
+    citations = get_citations(cleaned_text, tokenizer=TOKENIZER)
 
     return citations
 
@@ -32,9 +44,11 @@ def print_citation_details(citation):
     """
     print(getattr(citation, 'corrected_citation', 'Attribute not found'))
 
-text = "We conclude that this approach was error. The law has long accommodated new technologies within existing legal frameworks. See, e.g., Kyllo v. United States, 533 U.S. 27, 33-40 (2001) (holding that the use of thermal imaging technology can constitute a search under the Fourth Amendment); Thyroff v. Nationwide Mut. Ins. Co., 8 N.Y.3d 283, 292-93 (2007) (treating electronic records as property equivalent to physical records for the purposes of conversion)."
+# Example usage
+if __name__ == "__main__":
+    text = "We conclude that this approach was error. The law has long accommodated new technologies within existing legal frameworks. See, e.g., Kyllo v. United States, 533 U.S. 27, 33-40 (2001) (holding that the use of thermal imaging technology can constitute a search under the Fourth Amendment); Thyroff v. Nationwide Mut. Ins. Co., 8 N.Y.3d 283, 292-93 (2007) (treating electronic records as property equivalent to physical records for the purposes of conversion)."
 
-citations = extract_citations(text)
-full_case_citation = find_first_full_case_citation(citations)
-if full_case_citation is not None:
-    print_citation_details(full_case_citation)
+    citations = extract_citations(text)
+    full_case_citation = find_first_full_case_citation(citations)
+    if full_case_citation is not None:
+        print_citation_details(full_case_citation)
@@ -3,11 +3,37 @@ import json  # For pretty printing JSON output
 from eyecite import get_citations, resolve_citations
 from eyecite.clean import clean_text
 
+def _full_case_citation_to_dict(citation):
+    return {
+        "type": "FullCaseCitation",
+        "volume": citation.groups.get('volume'),
+        "reporter": citation.groups.get('reporter'),
+        "page": citation.groups.get('page'),
+        "year": citation.metadata.year,
+        "court": getattr(citation.metadata, 'court', None)
+    }
+
+def _statute_citation_to_dict(citation):
+    return {
+        "type": "StatuteCitation",
+        "title": citation.groups.get('title'),
+        "section": citation.groups.get('section')
+    }
+
+def _unknown_citation_to_dict(citation):
+    return {"type": "Unknown", "details": str(citation)}
+
+# Citation class name -> converter. Extend with more citation types as needed.
+CITATION_CONVERTERS = {
+    'FullCaseCitation': _full_case_citation_to_dict,
+    'StatuteCitation': _statute_citation_to_dict,
+}
+
 def resource_to_dict(resource):
     """
     Converts a Resource object into a dictionary by dynamically handling
-    different types of citations. It checks for the citation's type and 
-    formats the output accordingly.
+    different types of citations. It looks up the converter for the citation's
+    type in CITATION_CONVERTERS and formats the output accordingly.
 
     Args:
         resource (Resource): The Resource object to convert into a dictionary.
@@ -24,25 +50,8 @@ def resource_to_dict(resource):
     """
     if hasattr(resource, 'citation'):
         citation = resource.citation
-        citation_type = type(citation).__name__
-        if citation_type == 'FullCaseCitation':
-            return {
-                "type": "FullCaseCitation",
-                "volume": citation.volume,
-                "reporter": citation.reporter,
-                "page": citation.page,
-                "year": citation.year,
-                "court": getattr(citation, 'court', None)
-            }
-        elif citation_type == 'StatuteCitation':
-            return {
-                "type": "StatuteCitation",
-                "title": citation.title,
-                "section": citation.section
-            }
-        # Extend with more citation types as needed
-        else:
-            return {"type": "Unknown", "details": str(citation)}
+        converter = CITATION_CONVERTERS.get(type(citation).__name__, _unknown_citation_to_dict)
+        return converter(citation)
     return None
 
 def extract_text_from_pdf(pdf_path):
@@ -54,6 +63,25 @@ def extract_text_from_pdf(pdf_path):
     doc.close()
     return text
 
+def extract_citations_from_pdf(pdf_path):
+    """
+    Extracts citations from a PDF one page at a time.
+
+    Only a single page of text is held in memory at once. A citation that is
+    split across a page break will not be found. Blank and image-only pages
+    are skipped, since eyecite rejects empty text.
+    """
+    citations = []
+    doc = fitz.open(pdf_path)
+    try:
+        for page in doc:
+            text = page.get_text()
+            if text.strip():
+                citations.extend(get_citations(text))
+    finally:
+        doc.close()
+    return citations
+
 def extract_and_resolve_citations(text):
     """
     Extracts and resolves citations from text using eyecite.
@@ -68,9 +96,9 @@ def extract_text_and_resolve_citations(pdf_path):
     """
     Extracts text from a PDF and resolves any legal citations found.
     """
-    text = extract_text_from_pdf(pdf_path)
-    resolved_citations = extract_and_resolve_citations(text)
-    return [resource_to_dict(citation) for citation in resolved_citations if resource_to_dict(citation)]
+    resolved_citations = resolve_citations(extract_citations_from_pdf(pdf_path))
+    citation_dicts = (resource_to_dict(citation) for citation in resolved_citations)
+    return [citation_dict for citation_dict in citation_dicts if citation_dict]
 
 # Example usage (commented out - provide your own PDF path)
 # if __name__ == "__main__":
@@ -7,14 +7,40 @@ and enrichment with proper error handling, type hints, and thread safety.
 
 from typing import List, Dict, Optional, Tuple, Any
 from eyecite import get_citations, resolve_citations
-from eyecite.clean import clean_text
+from eyecite.clean import all_whitespace, clean_text, html, inline_whitespace, underscores
+from eyecite.tokenizers import Tokenizer, default_tokenizer
+import httpx
 from openai import OpenAI
+from semantic_cache import SemanticCache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import diskcache
+import functools
+import json
 import logging
 import os
-import time
-from queue import Queue
+import re
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import hyperscan  # noqa: F401  (optional accelerator, see get_tokenizer)
+    from eyecite.tokenizers import HyperscanTokenizer
+except ImportError:
+    HyperscanTokenizer = None  # type: ignore[misc,assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import h2  # noqa: F401  (lets httpx negotiate HTTP/2, see get_openai_client)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -31,7 +57,18 @@ class Config:
         self.max_workers = int(os.getenv('MAX_WORKERS', '10'))
         self.gpt4_model = os.getenv('GPT4_MODEL', 'gpt-4-1106-preview')
         self.request_timeout = int(os.getenv('REQUEST_TIMEOUT', '30'))
+        self.connect_timeout = float(os.getenv('CONNECT_TIMEOUT', '3.05'))
         self.max_retries = int(os.getenv('MAX_RETRIES', '3'))
+        self.hyperscan_cache_dir = os.getenv('HYPERSCAN_CACHE_DIR', '.hyperscan_cache')
+        self.cache_dir = os.getenv('CACHE_DIR', '.bluebook_cache')
+        self.court_listener_cache_ttl = int(os.getenv('COURT_LISTENER_CACHE_TTL', '86400'))
+        self.gpt4_cache_ttl = int(os.getenv('GPT4_CACHE_TTL', '604800'))
+        self.semantic_cache_enabled = os.getenv('SEMANTIC_CACHE_ENABLED', 'false').lower() == 'true'
+        self.semantic_cache_threshold = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.97'))
+        self.embedding_model = os.getenv('EMBEDDING_MODEL', 'text-embedding-3-small')
+        self.court_listener_rps = float(os.getenv('COURT_LISTENER_RPS', '5'))
+        self.court_listener_burst = int(os.getenv('COURT_LISTENER_BURST', '10'))
+        self.court_listener_max_results = int(os.getenv('COURT_LISTENER_MAX_RESULTS', '3'))
 
     def validate(self) -> None:
         """Validate that required configuration is present."""
@@ -44,10 +81,235 @@ class Config:
 # Global configuration instance
 config = Config()
 
+COURT_LISTENER_SEARCH_URL = "https://www.courtlistener.com/api/rest/v3/search/"
+
+# Fields kept from each Court Listener search result; the rest (opinion text,
+# snippets, etc.) is dropped as soon as the response is parsed
+COURT_LISTENER_FIELDS = (
+    'caseName', 'citation', 'court', 'dateFiled', 'docketNumber', 'absolute_url'
+)
+
+# Cleaning steps for extract_citations, resolved to eyecite's functions once at import
+CLEANING_STEPS = (
+    html,                   # Removes HTML markup
+    inline_whitespace,      # Collapses multiple spaces or tabs into one space
+    all_whitespace,         # Collapses multiple whitespace characters into one space
+    underscores             # Removes strings of two or more underscores
+)
+
+
+def get_tokenizer() -> Tokenizer:
+    """
+    Get the eyecite tokenizer used for citation extraction.
+
+    Uses the Hyperscan tokenizer when the optional ``hyperscan`` package is
+    installed, matching all reporter patterns in a single pass over the text.
+    The compiled pattern database is cached in ``config.hyperscan_cache_dir``
+    so it is only built once. Falls back to eyecite's default tokenizer.
+
+    Returns:
+        Tokenizer instance to pass to ``get_citations``.
+    """
+    if HyperscanTokenizer is None:
+        return default_tokenizer
+    return HyperscanTokenizer(cache_dir=config.hyperscan_cache_dir)
+
+
+# Shared tokenizer instance (keeps the compiled Hyperscan database in memory)
+tokenizer = get_tokenizer()
+
+
+def warm_up() -> None:
+    """
+    Pay eyecite's one-time setup costs ahead of the first real request.
+
+    eyecite compiles reporter regexes lazily, and the Hyperscan tokenizer builds
+    or loads its pattern database on first use. Long-running services can call
+    this at startup so the first document processed is not slowed down.
+    """
+    resolve_citations(get_citations(
+        "See Roe v. Wade, 410 U.S. 113, 120 (1973); 42 U.S.C. § 1983; id. at 5.",
+        tokenizer=tokenizer
+    ))
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Create a full token bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens, i.e. the allowed burst size.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
 
+def create_session() -> requests.Session:
+    """
+    Create the HTTP session used for Court Listener requests.
+
+    The session keeps a connection pool sized for the worker threads, sends
+    the Court Listener token on every request, and retries rate-limited
+    and server error responses (honoring ``Retry-After``) with exponential
+    backoff and jitter.
+
+    Returns:
+        Configured requests session.
+    """
+    retry_options: Dict[str, Any] = {
+        'total': config.max_retries,
+        'backoff_factor': 1,
+        'status_forcelist': (429, 500, 502, 503, 504),
+        'allowed_methods': frozenset(['GET']),
+        'respect_retry_after_header': True,
+        'raise_on_status': False,
+    }
+    try:
+        # Jitter spreads out retries from worker threads that failed together
+        retry = Retry(backoff_jitter=0.5, **retry_options)
+    except TypeError:  # urllib3 < 2.0 has no backoff_jitter
+        retry = Retry(**retry_options)
+    adapter = HTTPAdapter(
+        pool_connections=config.max_workers,
+        pool_maxsize=config.max_workers * 2,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.headers['Authorization'] = f"Token {config.court_listener_token}"
+    return session
+
+
+# Shared session so all worker threads reuse the same keep-alive connections
+_session = create_session()
+
+# Keeps Court Listener requests below the API's rate limit across all threads
+_court_listener_limiter = TokenBucket(config.court_listener_rps, config.court_listener_burst)
+
+
+# Caches opened on first use; the lock stops concurrent worker threads from
+# each opening their own instance
+_cache: Optional[diskcache.Cache] = None
+_semantic_cache: Optional[SemanticCache] = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache() -> diskcache.Cache:
+    """
+    Get the persistent response cache shared by the Court Listener and GPT-4 lookups.
+
+    The cache directory is created on first use rather than at import time.
+
+    Returns:
+        The diskcache Cache stored in ``config.cache_dir``.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = diskcache.Cache(config.cache_dir)
+        return _cache
+
+
+def _get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Get the optional embedding-based cache in front of GPT-4.
+
+    Returns:
+        The shared SemanticCache, loaded on first use, or None if
+        SEMANTIC_CACHE_ENABLED is not set.
+    """
+    global _semantic_cache
+    if not config.semantic_cache_enabled:
+        return None
+    with _cache_lock:
+        if _semantic_cache is None:
+            # Embeddings from different models are not comparable (and may differ
+            # in size), so each embedding model gets its own directory
+            _semantic_cache = SemanticCache(
+                os.path.join(
+                    config.cache_dir, 'semantic', re.sub(r'[^\w.-]', '_', config.embedding_model)
+                ),
+                threshold=config.semantic_cache_threshold,
+                ttl=config.gpt4_cache_ttl
+            )
+        return _semantic_cache
+
+
+# JSON parser for API responses; orjson is much faster on large payloads
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_ABBREVIATION_SPACE_RE = re.compile(r'\.\s(?=\w\.)')
+
+
+def normalize_citation(citation: str) -> str:
+    """
+    Normalize a citation string for use as a cache key.
+
+    Lowercases the citation, collapses whitespace, and removes spaces inside
+    abbreviations so that e.g. "410 U. S. 113" and "410 U.S. 113" share a key.
+
+    Args:
+        citation: The citation string to normalize.
+
+    Returns:
+        The normalized citation string.
+    """
+    normalized = _WHITESPACE_RE.sub(' ', citation.strip().lower())
+    return _ABBREVIATION_SPACE_RE.sub('.', normalized)
+
+
+def _gpt4_cache_key(citation: str) -> Tuple[str, str, str]:
+    """
+    Build the cache key for a citation's GPT-4 feedback.
+
+    GPT-4 critiques the citation's formatting, so unlike Court Listener lookups
+    the key keeps the citation text as written and only collapses whitespace.
+
+    Args:
+        citation: The citation string.
+
+    Returns:
+        The cache key tuple.
+    """
+    return ('gpt4', config.gpt4_model, _WHITESPACE_RE.sub(' ', citation.strip()))
+
+
+@functools.lru_cache(maxsize=1)
 def get_openai_client() -> OpenAI:
     """
-    Get configured OpenAI client.
+    Get the shared, configured OpenAI client.
+
+    The client is created on first use and reused afterwards, so all worker
+    threads share its HTTP connection pool. When the optional ``h2`` package is
+    installed the pool uses HTTP/2, multiplexing concurrent completions over
+    a single connection.
 
     Returns:
         Configured OpenAI client instance.
@@ -57,36 +319,33 @@ def get_openai_client() -> OpenAI:
     """
     if not config.openai_api_key:
         raise ValueError("OPENAI_API_KEY environment variable is required")
-    return OpenAI(api_key=config.openai_api_key)
+    return OpenAI(
+        api_key=config.openai_api_key,
+        http_client=httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=config.max_workers,
+                max_keepalive_connections=config.max_workers
+            )
+        )
+    )
 
 
-def gpt4_parse_citations(
+def _request_gpt4_feedback(
     citations: List[str],
-    client: Optional[OpenAI] = None
-) -> Optional[str]:
+    client: OpenAI
+) -> Optional[Dict[str, Optional[str]]]:
     """
-    Parse legal citations for factual accuracy and Legal Bluebook compliance using GPT-4.
+    Send citations to GPT-4 in a single chat completion.
 
     Args:
-        citations: A list of legal citation strings to be parsed.
-        client: Optional OpenAI client instance. If None, a new client is created.
+        citations: A non-empty list of unique legal citation strings.
+        client: OpenAI client instance.
 
     Returns:
-        The parsed content from GPT-4, or None if the API request fails.
-
-    Raises:
-        TypeError: If citations is not a list.
-        ValueError: If citations list is empty.
+        A dictionary mapping each citation string to its GPT-4 feedback, or None
+        if the API request fails or the response cannot be parsed.
     """
-    if not isinstance(citations, list):
-        raise TypeError(f"citations must be a list, got {type(citations).__name__}")
-
-    if not citations:
-        raise ValueError("citations list cannot be empty")
-
-    if client is None:
-        client = get_openai_client()
-
     messages = [
         {
             "role": "system",
@@ -95,36 +354,178 @@ def gpt4_parse_citations(
                 "the provided legal citations for factual accuracy (e.g., does the citation "
                 "contain the correct year of case, the correct court, parties, reporter, "
                 "volume, pages, etc.) and for 21st edition Legal Bluebook compliance. "
-                "If you do not know the correct information, tell the user you are not sure."
+                "If you do not know the correct information, tell the user you are not sure. "
+                "The citations are given as a numbered list. Respond with a JSON object of "
+                'the form {"results": [{"i": <number>, "feedback": "<feedback>"}, ...]} '
+                "containing one entry per citation."
             )
+        },
+        {
+            "role": "user",
+            "content": "\n".join(f"{i}. {citation}" for i, citation in enumerate(citations))
         }
-    ] + [{"role": "user", "content": citation} for citation in citations]
+    ]
 
+    # Stream the completion: a large batch can take longer than the timeout to
+    # generate, but streamed chunks keep arriving well within it
     try:
-        completion = client.chat.completions.create(
+        stream = client.chat.completions.create(
             model=config.gpt4_model,
             messages=messages,
+            response_format={"type": "json_object"},
+            stream=True,
+            timeout=config.request_timeout
+        )
+        content = "".join(
+            chunk.choices[0].delta.content or ""
+            for chunk in stream
+            if chunk.choices
+        )
+    except Exception as e:
+        logger.error("GPT-4 API request failed: %s", e, exc_info=True)
+        return None
+
+    feedback: Dict[str, Optional[str]] = dict.fromkeys(citations)
+    try:
+        for entry in _json_loads(content)["results"]:
+            index = int(entry["i"])
+            if 0 <= index < len(citations):
+                feedback[citations[index]] = entry.get("feedback")
+    except (TypeError, ValueError, KeyError) as e:
+        logger.error("Could not parse GPT-4 response: %s", e, exc_info=True)
+        return None
+
+    return feedback
+
+
+def _embed_citations(citations: List[str], client: OpenAI) -> Optional[List[List[float]]]:
+    """
+    Embed citation strings for the semantic cache.
+
+    Args:
+        citations: A non-empty list of legal citation strings.
+        client: OpenAI client instance.
+
+    Returns:
+        One embedding vector per citation, or None if the API request fails.
+    """
+    try:
+        response = client.embeddings.create(
+            model=config.embedding_model,
+            input=citations,
             timeout=config.request_timeout
         )
-        return completion.choices[0].message.content
     except Exception as e:
-        logger.error(f"GPT-4 API request failed: {e}", exc_info=True)
+        logger.error("Embedding API request failed: %s", e, exc_info=True)
         return None
+    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+def gpt4_parse_citations(
+    citations: List[str],
+    client: Optional[OpenAI] = None,
+    force_refresh: bool = False
+) -> Dict[str, Optional[str]]:
+    """
+    Parse legal citations for factual accuracy and Legal Bluebook compliance using GPT-4.
+
+    Feedback is cached on disk per citation. When the semantic cache is
+    enabled, remaining citations are embedded and answered from the most similar
+    previously checked citation. Citations without a cached answer are sent in a
+    single chat completion as a numbered list, and the model is asked for a JSON
+    object with one feedback entry per citation.
+
+    Args:
+        citations: A list of legal citation strings to be parsed.
+        client: Optional OpenAI client instance. If None, the shared client is used.
+        force_refresh: If True, ignore cached feedback and query GPT-4 again.
+
+    Returns:
+        A dictionary mapping each citation string to its GPT-4 feedback. Citations
+        the model did not answer, or that could not be checked because the API
+        request failed, map to None; cached feedback is still returned.
+
+    Raises:
+        TypeError: If citations is not a list.
+        ValueError: If citations list is empty.
+    """
+    if not isinstance(citations, list):
+        raise TypeError(f"citations must be a list, got {type(citations).__name__}")
+
+    if not citations:
+        raise ValueError("citations list cannot be empty")
+
+    feedback: Dict[str, Optional[str]] = {}
+    if not force_refresh:
+        for citation in citations:
+            cached = _get_cache().get(_gpt4_cache_key(citation))
+            if cached is not None:
+                feedback[citation] = cached
+
+    pending = [citation for citation in dict.fromkeys(citations) if citation not in feedback]
+    if not pending:
+        return feedback
+
+    if client is None:
+        client = get_openai_client()
+
+    embeddings: Dict[str, List[float]] = {}
+    semantic_cache = _get_semantic_cache()
+    if semantic_cache is not None:
+        vectors = _embed_citations(pending, client)
+        if vectors is not None:
+            embeddings = dict(zip(pending, vectors))
+            if not force_refresh:
+                for citation, vector in embeddings.items():
+                    cached = semantic_cache.lookup(vector, citation, config.gpt4_model)
+                    if cached is not None:
+                        feedback[citation] = cached
+                pending = [citation for citation in pending if citation not in feedback]
+                if not pending:
+                    return feedback
+
+    response = _request_gpt4_feedback(pending, client)
+    if response is None:
+        feedback.update(dict.fromkeys(pending))
+        return feedback
+
+    for citation, citation_feedback in response.items():
+        if citation_feedback is not None:
+            _get_cache().set(
+                _gpt4_cache_key(citation),
+                citation_feedback,
+                expire=config.gpt4_cache_ttl,
+                tag='gpt4'
+            )
+            if semantic_cache is not None and citation in embeddings:
+                semantic_cache.add(
+                    embeddings[citation], citation, citation_feedback, config.gpt4_model
+                )
+    feedback.update(response)
+    return feedback
 
 
 def fetch_case_data_from_court_listener(
     citation: str,
-    max_retries: Optional[int] = None
+    force_refresh: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
-    Fetch case data from the Court Listener API with retry logic.
+    Fetch case data from the Court Listener API.
+
+    Successful responses are cached on disk per normalized citation. Requests are
+    paced by a token bucket (``config.court_listener_rps``) so the API's rate limit
+    is not hit, and go through the shared module session, which reuses pooled
+    keep-alive connections and retries rate-limited (429) and server error
+    responses with exponential backoff.
 
     Args:
         citation: The legal citation to fetch case data for.
-        max_retries: Maximum number of retry attempts. Defaults to config value.
+        force_refresh: If True, ignore any cached response and query the API again.
 
     Returns:
-        The case data retrieved from the API, or None if all retries fail.
+        A dictionary with the total match ``count`` and up to
+        ``config.court_listener_max_results`` ``results``, each limited to
+        ``COURT_LISTENER_FIELDS``, or None if the request fails.
 
     Raises:
         TypeError: If citation is not a string.
@@ -136,89 +537,131 @@ def fetch_case_data_from_court_listener(
     if not citation.strip():
         raise ValueError("citation cannot be empty")
 
-    if max_retries is None:
-        max_retries = config.max_retries
+    cache_key = ('court_listener', normalize_citation(citation))
+    if not force_refresh:
+        cached = _get_cache().get(cache_key)
+        if cached is not None:
+            return cached
 
-    url = f"https://www.courtlistener.com/api/rest/v3/search/?type=o&q={citation}"
-    headers = {'Authorization': f"Token {config.court_listener_token}"}
+    _court_listener_limiter.acquire()
+    try:
+        response = _session.get(
+            COURT_LISTENER_SEARCH_URL,
+            params={'type': 'o', 'q': citation},
+            timeout=(config.connect_timeout, config.request_timeout)
+        )
+    except requests.exceptions.RequestException as e:
+        logger.error(
+            "Court Listener request failed for citation %s: %s", citation, e, exc_info=True
+        )
+        return None
 
-    for attempt in range(max_retries):
+    if response.status_code == 200:
         try:
-            response = requests.get(
-                url,
-                headers=headers,
-                timeout=config.request_timeout
-            )
+            payload = _json_loads(response.content)
+        except ValueError as e:
+            logger.error("Court Listener returned invalid JSON: %s", e, exc_info=True)
+            return None
+        data = {
+            'count': payload.get('count'),
+            'results': [
+                {field: result.get(field) for field in COURT_LISTENER_FIELDS}
+                for result in payload.get('results', [])[:config.court_listener_max_results]
+            ]
+        }
+        _get_cache().set(cache_key, data, expire=config.court_listener_cache_ttl, tag='court_listener')
+        return data
+
+    logger.error(
+        "Court Listener API request failed with status %d: %s",
+        response.status_code,
+        response.text
+    )
+    return None
 
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:  # Rate limit
-                wait_time = int(response.headers.get('Retry-After', 60))
-                logger.warning(f"Rate limited. Waiting {wait_time} seconds.")
-                time.sleep(wait_time)
-            elif response.status_code >= 500:  # Server error
-                logger.error(
-                    f"Server error {response.status_code}. "
-                    f"Retry {attempt + 1}/{max_retries}"
-                )
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-            else:
-                logger.error(
-                    f"Court Listener API request failed with status {response.status_code}: "
-                    f"{response.text}"
-                )
-                return None
 
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                f"Request exception on attempt {attempt + 1}/{max_retries}: {e}",
-                exc_info=True
-            )
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+def _citation_text(resource: Any) -> str:
+    """
+    Get the text of a resolved citation as it appears in the document.
 
-    logger.error(f"Failed to fetch data after {max_retries} attempts for citation: {citation}")
-    return None
+    Args:
+        resource: A key of the ``resolve_citations`` result.
+
+    Returns:
+        The citation's matched text, or ``str(resource)`` for resources that
+        do not wrap an eyecite citation.
+    """
+    citation = getattr(resource, 'citation', None)
+    if citation is None:
+        return str(resource)
+    text: str = citation.matched_text()
+    return text
 
 
-def process_citations_batch(
-    citations_batch: List[Any],
-    results_queue: Queue,
-    client: Optional[OpenAI] = None
-) -> None:
+def _case_lookup_text(resource: Any) -> str:
     """
-    Process a batch of citations with thread-safe result storage.
+    Get the text used to look a resolved citation up on Court Listener.
+
+    eyecite's corrected citation holds only what identifies the case (volume,
+    canonical reporter and page, without pin cites or parentheticals), so
+    variants such as "410 U. S. 113" and "410 US 113, 120" share one lookup
+    and one cache entry.
 
     Args:
-        citations_batch: A list of citations to process.
-        results_queue: Thread-safe queue for storing results.
-        client: Optional OpenAI client instance.
+        resource: A key of the ``resolve_citations`` result.
+
+    Returns:
+        The corrected citation, or ``str(resource)`` for resources that do not
+        wrap an eyecite citation.
     """
-    for citation in citations_batch:
-        try:
-            citation_str = str(citation)
-            court_listener_data = fetch_case_data_from_court_listener(citation_str)
-            gpt4_feedback = gpt4_parse_citations([citation_str], client=client)
-            results_queue.put((citation_str, gpt4_feedback, court_listener_data))
-        except Exception as e:
-            logger.error(f"Error processing citation {citation}: {e}", exc_info=True)
-            results_queue.put((str(citation), None, None))
+    citation = getattr(resource, 'citation', None)
+    if citation is None:
+        return str(resource)
+    lookup_text: str = citation.corrected_citation()
+    return lookup_text
+
+
+def _future_result(future: Future, description: str, *args: Any) -> Any:
+    """
+    Return a worker future's result, logging and returning None on failure.
+
+    Args:
+        future: The future to wait for.
+        description: What the worker was doing, as a logging format string.
+        *args: Arguments for ``description``, formatted only if an error is logged.
+
+    Returns:
+        The future's result, or None if the worker raised an exception.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error("Error " + description + ": %s", *args, e, exc_info=True)
+        return None
 
 
 def check_citations(
     text: str,
-    batch_size: Optional[int] = None
+    batch_size: Optional[int] = None,
+    force_refresh: bool = False
 ) -> List[Tuple[str, Optional[str], Optional[Dict[str, Any]]]]:
     """
-    Check citations in the given text using multi-threaded processing.
+    Check citations in the given text using a bounded pool of worker threads.
+
+    Citations are checked with GPT-4 in batches of ``batch_size`` while their Court
+    Listener lookups run concurrently on the same pool. GPT-4 sees each citation as
+    written; Court Listener is queried once per case, using eyecite's corrected
+    citation. At most ``config.max_workers``
+    requests are in flight at any time.
 
     Args:
         text: The text to check for citations.
-        batch_size: Number of citations to process per batch. Defaults to config value.
+        batch_size: Number of citations per GPT-4 request. Defaults to config value.
+        force_refresh: If True, bypass cached Court Listener and GPT-4 responses.
 
     Returns:
-        A list of tuples containing (citation_text, gpt4_feedback, court_listener_data).
+        A list of tuples containing (citation_text, gpt4_feedback, court_listener_data),
+        in the order the citations appear in the text.
 
     Raises:
         TypeError: If text is not a string.
@@ -234,48 +677,64 @@ def check_citations(
     if batch_size is None:
         batch_size = config.batch_size
 
-    # Clean and extract citations
-    cleaning_steps = []
-    cleaned_text = clean_text(text, steps=cleaning_steps)
-    citations = get_citations(cleaned_text)
+    # Extract citations (the text is used as-is, without cleaning steps)
+    citations = get_citations(text, tokenizer=tokenizer)
     normalized_citations = resolve_citations(citations)
 
-    if not isinstance(normalized_citations, list):
-        normalized_citations = list(normalized_citations)
+    # Iterate the resolutions directly; no need to copy them into a list first.
+    # The keys are eyecite Resource objects wrapping the parsed citation.
+    citation_strs = [_citation_text(resource) for resource in normalized_citations]
+    lookup_strs = [_case_lookup_text(resource) for resource in normalized_citations]
 
-    if not normalized_citations:
+    if not citation_strs:
         logger.info("No citations found in text")
         return []
 
-    logger.info(f"Found {len(normalized_citations)} citations to process")
-
-    # Thread-safe queue for results
-    results_queue: Queue = Queue()
-    threads = []
+    logger.info("Found %d citations to process", len(citation_strs))
 
-    # Create OpenAI client once and share across threads
+    # Shared OpenAI client used by all worker threads
     client = get_openai_client()
 
-    # Process citations in batches using threads
-    for i in range(0, len(normalized_citations), batch_size):
-        batch = normalized_citations[i:i + batch_size]
-        thread = threading.Thread(
-            target=process_citations_batch,
-            args=(batch, results_queue, client)
-        )
-        threads.append(thread)
-        thread.start()
+    # Repeated references are looked up once and fanned back out below
+    unique_strs = list(dict.fromkeys(citation_strs))
+    batches = [
+        unique_strs[i:i + batch_size]
+        for i in range(0, len(unique_strs), batch_size)
+    ]
+
+    # The GPT-4 batches and the Court Listener lookups are independent, so
+    # submit them all to the pool together. GPT-4 goes first as the slower call.
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        gpt4_futures = [
+            executor.submit(gpt4_parse_citations, batch, client, force_refresh)
+            for batch in batches
+        ]
+        court_listener_futures = {
+            lookup_str: executor.submit(
+                fetch_case_data_from_court_listener, lookup_str, force_refresh
+            )
+            for lookup_str in dict.fromkeys(lookup_strs)
+        }
 
-    # Wait for all threads to complete
-    for thread in threads:
-        thread.join()
+        gpt4_feedback: Dict[str, Optional[str]] = {}
+        for future in gpt4_futures:
+            gpt4_feedback.update(_future_result(future, "checking citations with GPT-4") or {})
 
-    # Convert queue to list
-    results = []
-    while not results_queue.empty():
-        results.append(results_queue.get())
+        court_listener_data = {
+            lookup_str: _future_result(future, "fetching case data for %s", lookup_str)
+            for lookup_str, future in court_listener_futures.items()
+        }
 
-    logger.info(f"Processed {len(results)} citations")
+    results = [
+        (citation_str, gpt4_feedback.get(citation_str), court_listener_data[lookup_str])
+        for citation_str, lookup_str in zip(citation_strs, lookup_strs)
+    ]
+
+    semantic_cache = _get_semantic_cache()
+    if semantic_cache is not None:
+        semantic_cache.save()
+
+    logger.info("Processed %d citations", len(results))
     return results
 
 
@@ -295,16 +754,8 @@ def extract_citations(text: str) -> List[Any]:
     if not isinstance(text, str):
         raise TypeError(f"text must be a string, got {type(text).__name__}")
 
-    # Define cleaning steps
-    steps = [
-        'html',                 # Removes HTML markup
-        'inline_whitespace',    # Collapses multiple spaces or tabs into one space
-        'all_whitespace',       # Collapses multiple whitespace characters into one space
-        'underscores'           # Removes strings of two or more underscores
-    ]
-
     # Clean the text and extract citations
-    cleaned_text = clean_text(text, steps)
-    citations = get_citations(cleaned_text)
+    cleaned_text = clean_text(text, CLEANING_STEPS)
+    citations = get_citations(cleaned_text, tokenizer=tokenizer)
 
     return list(citations)
@@ -8,17 +8,20 @@ This is a wrapper around the core module for backward compatibility.
 For new code, consider importing from core.py directly.
 """
 
-from core import check_citations
+from core import check_citations, warm_up
 import logging
 
-# Set up basic logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
 # Example usage
 if __name__ == "__main__":
+    # Set up basic logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Pay eyecite's one-time setup cost up front, as a service would at startup
+    warm_up()
+
     example_text = (
         "As held in Roe v. Wade, 410 U.S. 113 (1973), privacy rights are fundamental. "
         "See also Planned Parenthood v. Casey, 505 U.S. 833 (1993)."
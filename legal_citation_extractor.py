@@ -1,11 +1,9 @@
 import pandas as pd
 import eyecite
 from eyecite import get_citations, resolve_citations
-from openai import OpenAI
-import os
 
-# Initialize the OpenAI client with your API key
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+# Columns of the DataFrame returned by extract_citations_with_features
+COLUMNS = ["Citation", "Type", "Signal", "Year", "Court", "Page", "Volume", "Reporter", "Case Name"]
 
 def extract_citations_with_features(text):
     # Clean the text and extract citations using eyecite
@@ -17,31 +15,38 @@ def extract_citations_with_features(text):
     # Initialize an empty list to store the features of each citation
     citations_data = []
     
-    # Iterate over the resolved citations and extract their features
-    for citation in resolved_citations:
+    # Iterate over the resolved citations and extract their features.
+    # resolve_citations yields Resource objects; the parsed citation is
+    # stored on resource.citation
+    for resource in resolved_citations:
+        citation = resource.citation
+        metadata = citation.metadata
+        plaintiff = getattr(metadata, 'plaintiff', None)
+        defendant = getattr(metadata, 'defendant', None)
         citation_data = {
-            "Citation": str(citation),
+            "Citation": citation.matched_text(),
             "Type": type(citation).__name__,
-            "Signal": citation.metadata.signal if citation.metadata else None,
-            "Year": citation.metadata.year if citation.metadata else None,
-            "Court": citation.metadata.court if citation.metadata else None,
-            "Page": citation.metadata.pin_cite if citation.metadata else None,
-            "Volume": citation.volume.volume if citation.volume else None,
-            "Reporter": citation.reporter.reporter if citation.reporter else None,
-            "Case Name": citation.metadata.case_name if citation.metadata else None
+            "Signal": getattr(metadata, 'signal', None),
+            "Year": getattr(metadata, 'year', None),
+            "Court": getattr(metadata, 'court', None),
+            "Page": getattr(metadata, 'pin_cite', None),
+            "Volume": citation.groups.get('volume'),
+            "Reporter": citation.groups.get('reporter'),
+            "Case Name": f"{plaintiff} v. {defendant}" if plaintiff and defendant else None
         }
         citations_data.append(citation_data)
     
-    # Convert the list of dictionaries to a DataFrame
-    df = pd.DataFrame(citations_data)
+    # Convert the list of dictionaries to a DataFrame in one step
+    df = pd.DataFrame(citations_data, columns=COLUMNS)
     return df
 
-# Example text containing legal citations
-text = """
-The Supreme Court of the United States has held that the First Amendment protects freedom of speech. 
-See, e.g., Marbury v. Madison, 5 U.S. 137, 177–79 (1803); 42 U.S.C. §§ 2000e et seq.
-"""
+if __name__ == "__main__":
+    # Example text containing legal citations
+    text = """
+    The Supreme Court of the United States has held that the First Amendment protects freedom of speech. 
+    See, e.g., Marbury v. Madison, 5 U.S. 137, 177–79 (1803); 42 U.S.C. §§ 2000e et seq.
+    """
 
-# Extract citations and their features from the example text
-df = extract_citations_with_features(text)
-print(df)
+    # Extract citations and their features from the example text
+    df = extract_citations_with_features(text)
+    print(df)
@@ -1,22 +1,73 @@
-from PyPDF2 import PdfReader
+import fitz  # PyMuPDF
+import os
+from concurrent.futures import ProcessPoolExecutor
 from eyecite import get_citations, resolve_citations
-from eyecite.clean import clean_text
+from eyecite.clean import all_whitespace, clean_text, html, inline_whitespace, underscores
 
-def extract_citations(text):
-    # Define the cleaning steps using actual functions from eyecite.clean
-    steps = [
-        'html',                 # Removes HTML markup
-        'inline_whitespace',    # Collapses multiple spaces or tabs into one space
-        'all_whitespace',       # Collapses multiple whitespace characters into one space
-        'underscores'           # Removes strings of two or more underscores
-    ]
+# Define the cleaning steps once using actual functions from eyecite.clean
+STEPS = (
+    html,                   # Removes HTML markup
+    inline_whitespace,      # Collapses multiple spaces or tabs into one space
+    all_whitespace,         # Collapses multiple whitespace characters into one space
+    underscores             # Removes strings of two or more underscores
+)
 
+def extract_citations(text):
     # Clean the text and extract citations
-    cleaned_text = clean_text(text, steps)
+    cleaned_text = clean_text(text, STEPS)
     citations = get_citations(cleaned_text)
 
     return citations
 
+def _extract_page_range(pdf_path, start, stop):
+    """
+    Extract the text of pages ``start`` to ``stop - 1`` of a PDF.
+
+    Runs in a worker process, so it opens its own copy of the document.
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        return [doc[i].get_text() for i in range(start, stop)]
+    finally:
+        doc.close()
+
+def extract_text_from_pdf(pdf_path, max_workers=1):
+    """
+    Extract the text of every page of a PDF.
+
+    By default pages are extracted in-process. MuPDF extracts a dense page in
+    a few milliseconds, so starting worker processes usually costs more than
+    it saves, especially where they are spawned (Windows, macOS) and each
+    worker re-imports this module and eyecite. For very large documents on
+    multi-core machines, pass ``max_workers`` to split the pages into
+    contiguous ranges extracted in separate processes; the call must then be
+    made from under an ``if __name__ == "__main__":`` guard on platforms that
+    spawn workers.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        max_workers: Maximum number of worker processes. Defaults to 1, which
+            disables parallel extraction; None uses the number of CPUs.
+
+    Returns:
+        The text of all pages joined with newlines.
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        page_count = doc.page_count
+        max_workers = min(max_workers or os.cpu_count() or 1, page_count or 1)
+        if max_workers == 1:
+            return "\n".join(page.get_text() for page in doc)
+    finally:
+        doc.close()
+
+    chunk_size = -(-page_count // max_workers)  # ceiling division
+    starts = range(0, page_count, chunk_size)
+    stops = [min(start + chunk_size, page_count) for start in starts]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        page_ranges = executor.map(_extract_page_range, [pdf_path] * len(starts), starts, stops)
+        return "\n".join(text for page_range in page_ranges for text in page_range)
+
 def find_first_full_case_citation(citations):
     for citation in citations:
         if citation.__class__.__name__ == "FullCaseCitation":
@@ -44,10 +95,7 @@ def print_citation_details(citation):
 #         pdf_path = 'path/to/your/legal_document.pdf'
 #
 #     # Read the PDF file and extract text
-#     reader = PdfReader(pdf_path)
-#     text = ""
-#     for page in reader.pages:
-#         text += page.extract_text()
+#     text = extract_text_from_pdf(pdf_path)
 #
 #     citations = extract_citations(text)
 #     full_case_citation = find_first_full_case_citation(citations)
@@ -0,0 +1,174 @@
+"""
+Embedding-based semantic cache for GPT-4 citation feedback.
+
+Citations that differ only cosmetically (e.g. "Roe v. Wade, 410 U.S. 113 (1973)"
+and "Roe v Wade, 410 US 113, 1973") miss an exact-key cache but have nearly
+identical embeddings. This module stores citation embeddings alongside their
+GPT-4 feedback and answers lookups from the most similar stored citation.
+
+Embeddings of short citations that differ only in a volume or page number can
+still be very similar, so a hit also requires the citations to contain the same
+numbers.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+_NUMBER_RE = re.compile(r'\d+')
+
+
+def _citation_numbers(citation: str) -> List[str]:
+    """Return the numbers (volume, page, year, ...) in a citation, in order."""
+    return _NUMBER_RE.findall(citation)
+
+
+class SemanticCache:
+    """Nearest-neighbor cache of GPT-4 feedback keyed by citation embeddings."""
+
+    def __init__(self, path: str, threshold: float = 0.97, ttl: Optional[float] = None):
+        """
+        Create a semantic cache, loading any entries previously saved at ``path``.
+
+        Args:
+            path: Directory used to persist the embeddings and feedback.
+            threshold: Minimum cosine similarity for a lookup to count as a hit.
+            ttl: Seconds an entry stays valid after it is added, or None to keep
+                entries indefinitely.
+        """
+        self.path = path
+        self.threshold = threshold
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._rows: List[np.ndarray] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._entries: List[Dict[str, Any]] = []
+        self._dirty = False
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        """Return the vector as a unit-length float32 array."""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _vectors(self) -> np.ndarray:
+        """Return the stored embeddings as one matrix, stacking new rows if needed."""
+        if self._matrix is None or len(self._matrix) != len(self._rows):
+            self._matrix = np.vstack(self._rows)
+        return self._matrix
+
+    def lookup(self, vector: Sequence[float], citation: str, model: str) -> Optional[str]:
+        """
+        Find cached feedback for the citation most similar to ``vector``.
+
+        Args:
+            vector: Embedding of the citation to look up.
+            citation: The citation text; a hit must contain the same numbers.
+            model: GPT-4 model the feedback must have been produced by.
+
+        Returns:
+            The cached feedback if the nearest unexpired entry for ``model`` with the
+            same numbers as ``citation`` has a cosine similarity that meets the
+            threshold, otherwise None.
+        """
+        query = self._normalize(vector)
+        numbers = _citation_numbers(citation)
+        now = time.time()
+        with self._lock:
+            if not self._rows:
+                return None
+            similarities = self._vectors() @ query
+            for i, entry in enumerate(self._entries):
+                if (
+                    entry['model'] != model
+                    or (entry['expires'] is not None and entry['expires'] <= now)
+                    or _citation_numbers(entry.get('citation', '')) != numbers
+                ):
+                    similarities[i] = -np.inf
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                feedback: str = self._entries[best]['feedback']
+                return feedback
+        return None
+
+    def add(self, vector: Sequence[float], citation: str, feedback: str, model: str) -> None:
+        """
+        Store feedback for a citation embedding.
+
+        Args:
+            vector: Embedding of the citation.
+            citation: The citation text.
+            feedback: GPT-4 feedback for the citation.
+            model: GPT-4 model that produced the feedback.
+        """
+        row = self._normalize(vector)
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._rows.append(row)
+            self._entries.append({
+                'citation': citation, 'feedback': feedback, 'model': model, 'expires': expires
+            })
+            self._dirty = True
+
+    def load(self) -> None:
+        """Load persisted entries from ``self.path`` if present."""
+        vectors_path = os.path.join(self.path, 'vectors.npy')
+        feedback_path = os.path.join(self.path, 'feedback.json')
+        if not (os.path.exists(vectors_path) and os.path.exists(feedback_path)):
+            return
+
+        try:
+            vectors = np.load(vectors_path)
+            with open(feedback_path, encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error("Could not load semantic cache from %s: %s", self.path, e, exc_info=True)
+            return
+
+        if len(vectors) != len(entries) or not all(isinstance(e, dict) for e in entries):
+            logger.error("Semantic cache at %s is inconsistent; ignoring it", self.path)
+            return
+
+        with self._lock:
+            self._rows = list(vectors)
+            self._matrix = None
+            self._entries = entries
+            self._dirty = False
+
+    def save(self) -> None:
+        """
+        Persist entries to ``self.path`` if anything changed since the last save.
+
+        Expired entries are dropped before saving.
+        """
+        now = time.time()
+        with self._lock:
+            if not self._dirty:
+                return
+            keep = [
+                i for i, entry in enumerate(self._entries)
+                if entry['expires'] is None or entry['expires'] > now
+            ]
+            self._rows = [self._rows[i] for i in keep]
+            self._entries = [self._entries[i] for i in keep]
+            self._matrix = None
+            os.makedirs(self.path, exist_ok=True)
+            vectors = np.vstack(self._rows) if self._rows else np.empty((0, 0), dtype=np.float32)
+            np.save(os.path.join(self.path, 'vectors.npy'), vectors)
+            with open(os.path.join(self.path, 'feedback.json'), 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            self._dirty = False